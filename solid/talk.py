@@ -129,6 +129,9 @@ class BasicCalculator(Calculator):
         elif isinstance(operation, Subtraction):
             return operation.x - operation.y
 
+# note: swapping the ifs for a {Addition: ..., Subtraction: ...} dict only hides them,
+#       BasicCalculator still has to change for every new operation
+
 # SOLUTION #1: delegate to object, not touching on BasicCalculator to add new operations
 
 class Operation(object):
@@ -137,11 +140,11 @@ class Operation(object):
         self.y = y
 
 class Addition(Operation):
-    def peform_operation(self):
+    def perform_operation(self):
         return self.x + self.y
 
 class Subtraction(Operation):
-    def peform_operation(self):
+    def perform_operation(self):
         return self.x - self.y
 
 class BasicCalculator(Calculator):
@@ -166,7 +169,7 @@ class ReportGenerator(object):
     def print(self, filename, ink_type):
         if ink_type == 'BLACK':
             BWPrinter.print_file(filename)
-        else ink_type == 'COLOR':
+        elif ink_type == 'COLOR':
             ColorPrinter.print_file(filename)
         else:
             raise BaseException("There is no printer for that type")
@@ -190,7 +193,7 @@ class ReportGenerator(object):
         self.printer = printer
 
     def print(self, filename):
-        self.printer.print_file(filename)
+        self.printer.print(filename)
 
 # PROBLEM #3:
 
@@ -364,6 +367,7 @@ class Task(object):
     def close(self):
         if self.can_close():
             self.status = 'CLOSED'
+            return
         raise Exception("Cannot close Task") # exception expected on supertype
 
 class BasicTask(Task):
@@ -371,7 +375,7 @@ class BasicTask(Task):
 
 class ProjectTask(Task):
     def can_close(self):
-        return self.status == 'STARTED'
+        return self.status != 'STARTED'
 
 # PROBLEM #3: immutable point - allowed Under the definitions of Meyer and America
 #             History constraint (the "history rule").
@@ -414,11 +418,11 @@ class MutablePoint(Point):
 # PROBLEM #1: a lot of methods not being used
 
 class Charger(object):
-    def charge_usb1(self):
+    def charge_usb1(self, phone):
         IOUSB1.connect(phone)
-    def charge_usb2(self):
+    def charge_usb2(self, phone):
         IOUSB2.connect(phone)
-    def charge_apple(self):
+    def charge_apple(self, phone):
         IOAPPLE.connect(phone)
 
 class AndroidCharger(Charger):
@@ -430,7 +434,7 @@ class AppleCharger(Charger):
 # SOLUTION #1: abstract the methods and delegate. Leave details to implementation
 
 class Charger(object):
-    def connect(self):
+    def connect(self, phone):
         pass
     def disconnect(self):
         pass
@@ -438,11 +442,11 @@ class Charger(object):
         pass
 
 class AndroidCharger(Charger):
-    def connect(self):
+    def connect(self, phone):
         IOUSB2.connect(phone)
 
 class AppleCharger(Charger):
-    def connect(self):
+    def connect(self, phone):
         IOAPPLE.connect(phone)
 
 # PROBLEM #2: one method is not being used in one of the implementations